@@ -561,9 +561,11 @@ class AndroidHandler(Handler):
 
         :returns: True if it contains any else false.
         """
+        # `attrib` is built on first access, look it up once. The values of
+        # SKIP_ATTRIBUTES are strings, so a missing attribute never matches
+        attrib = child.attrib
         for key, value in six.iteritems(AndroidHandler.SKIP_ATTRIBUTES):
-            filter_attr = child.attrib.get(key)
-            if filter_attr is not None and filter_attr == value:
+            if attrib.get(key) == value:
                 return True
         return False
 
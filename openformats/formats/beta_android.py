@@ -79,7 +79,7 @@ class BetaAndroidHandler(Handler):
 
     def _handle_string_tag(self, tag, offset, comment):
         string = None
-        if tag.inner.strip() != "":
+        if tag.inner and not tag.inner.isspace():
             context = tag.attrs.get('product', "")
             string = OpenString(tag.attrs['name'], tag.inner,
                                 context=context, order=self._order,
@@ -116,7 +116,7 @@ class BetaAndroidHandler(Handler):
         for index, (item_tag, item_offset) in enumerate(
                 string_array_tag.find('item')):
             string = None
-            if item_tag.inner.strip() != "":
+            if item_tag.inner and not item_tag.inner.isspace():
                 string = OpenString(
                     "{}[{}]".format(string_array_tag.attrs['name'], index),
                     item_tag.inner,
@@ -161,7 +161,7 @@ class BetaAndroidHandler(Handler):
         first_item_offset = None
         strings = {}
         for item_tag, item_offset in plurals_tag.find('item'):
-            if item_tag.inner.strip() == "":
+            if not item_tag.inner or item_tag.inner.isspace():
                 strings = None
                 break
 
@@ -205,8 +205,7 @@ class BetaAndroidHandler(Handler):
         it will return True, else it returns False
         """
         for key, value in six.iteritems(self.FILTER_ATTRIBUTES):
-            filter_attr = tag.attrs.get(key, None)
-            if filter_attr is not None and filter_attr == value:
+            if tag.attrs.get(key) == value:
                 return True
         return False
 
@@ -35,6 +35,17 @@ class InDesignHandler(Handler):
     SPECIAL_CHARACTERS_REGEX = re.compile(
         ensure_unicode(r'<\?ACE \d+\?>|<Br/>;')
     )
+    HASH_REGEX = re.compile(ensure_unicode(r'[a-z,0-9]{32}_tr'))
+    # An ampersand that doesn't start a valid XML escape sequence
+    LONELY_AMP_REGEX = re.compile(
+        ensure_unicode(r'&(?!(?:lt|gt|amp|apos|quot|#\d+|#x[0-9a-fA-F]+);)')
+    )
+
+    # lxml parsers can be reused between documents, no need to create one for
+    # every designmap. Only the root's attributes are read, so there is no
+    # need for an ID lookup table either
+    DESIGNMAP_PARSER = etree.XMLParser(resolve_entities=False,
+                                       collect_ids=False)
 
     """ Parse Methods """
 
@@ -86,8 +97,8 @@ class InDesignHandler(Handler):
         BACKING_STORY = 'XML/BackingStory.xml'
 
         designmap = idml.get('designmap.xml')
-        parser = etree.XMLParser(resolve_entities=False)
-        designmap_tree = etree.fromstring(designmap, parser=parser)
+        designmap_tree = etree.fromstring(designmap,
+                                          parser=self.DESIGNMAP_PARSER)
 
         story_ids = designmap_tree.attrib.get("StoryList", "").split()
         story_keys = [STORY_KEY.format(s) for s in story_ids]
@@ -107,6 +118,8 @@ class InDesignHandler(Handler):
         Strings that contain only special characters or can be evaluated
         to a nunber are skipped.
         """
+        if not string or string.isspace():
+            return True
         stripped_string = re.\
             sub(ensure_unicode(self.SPECIAL_CHARACTERS_REGEX), u'', string).\
             strip()
@@ -177,12 +190,11 @@ class InDesignHandler(Handler):
         # Iterate over the contents of the IDML file
         for key in self._get_ordered_stories(idml):
             try:
-                story_content = idml[key]
+                # no matter what, idml values are bytes
+                story_content = idml[key].decode('utf-8')
             except KeyError:
                 continue
 
-            # no matter what, idml values are bytes
-            story_content = idml[key].decode('utf-8')
             idml[key] = self._compile_story(story_content).encode('utf-8')
 
         out = io.BytesIO()
@@ -197,30 +209,30 @@ class InDesignHandler(Handler):
             compiled_story: the compiled story content
         """
         transcriber = Transcriber(story_content)
-        hash_regex = re.compile(ensure_unicode(r'[a-z,0-9]{32}_tr'))
-        found = True
-        while found:
-            try:
-                current_string = self.stringset.pop(0)
-                hash_position = story_content.index(
-                    current_string.template_replacement
-                )
-            except ValueError:
-                found = False
-                self.stringset.insert(0, current_string)
-            except IndexError:
+        source = transcriber.source
+        # Hashes appear in the same order as the stringset, so each search
+        # can start where the previous replacement ended
+        search_from = 0
+        compiled_count = 0
+        for current_string in self.stringset:
+            template_replacement = current_string.template_replacement
+            hash_position = source.find(template_replacement, search_from)
+            if hash_position == -1:
                 break
-            else:
-                transcriber.copy_until(hash_position)
-                transcriber.add(self._escape_amps(current_string.string))
-                transcriber.skip(len(current_string.template_replacement))
+            transcriber.copy_until(hash_position)
+            transcriber.add(self._escape_amps(current_string.string))
+            transcriber.skip(len(template_replacement))
+            search_from = hash_position + len(template_replacement)
+            compiled_count += 1
+        # Strings that were not found are left for the stories that follow
+        del self.stringset[:compiled_count]
 
         # Update the XML file to contain the template strings
-        transcriber.copy_until(len(story_content))
+        transcriber.copy_until(len(source))
         compiled_story = transcriber.get_destination()
         # in case there are any hashes that have not been replaced, replace
         # them with an empty string
-        compiled_story = hash_regex.sub(u'', compiled_story)
+        compiled_story = self.HASH_REGEX.sub(u'', compiled_story)
         return compiled_story
 
     @staticmethod
@@ -238,24 +250,4 @@ class InDesignHandler(Handler):
             "&&#x05af;&&"         -> "&amp;&#x05af;&amp;&amp;"
         """
 
-        # Find "lonely" ampersand positions by finding all ampersand positions
-        # and subtracting the positions of ampersands that are part of valid
-        # XML escape sequences
-        all_amp_positions = {match.span()[0]
-                             for match in re.finditer(r'&', string)}
-        escaped_amp_positions = {
-            match.span()[0]
-            for match in re.finditer(
-                r'&(lt|gt|amp|apos|quot|#\d+|#x[0-9a-fA-F]+);', string
-            )
-        }
-        target_positions = sorted(all_amp_positions - escaped_amp_positions)
-
-        # Use Transcriber to replace lonely ampersands with '&amp;'
-        transcriber = Transcriber(string)
-        for position in target_positions:
-            transcriber.copy_until(position)
-            transcriber.add('&amp;')
-            transcriber.skip(1)
-        transcriber.copy_to_end()
-        return transcriber.get_destination()
+        return InDesignHandler.LONELY_AMP_REGEX.sub(u'&amp;', string)
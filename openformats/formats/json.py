@@ -46,6 +46,12 @@ class JsonHandler(Handler):
     PLURAL_ARG = 'plural'
     PLURAL_KEYS_STR = ' '.join(six.iterkeys(Handler._RULES_ATOI))
 
+    # Leftovers of removed sections and the tokens `_clean_empties` needs to
+    # look at in order to remove them: whitespace, JSON punctuation and
+    # anything in between
+    LEFTOVER_COMMA_PAT = re.compile(r'[{\[,]\s*,|,\s*[}\]]', re.UNICODE)
+    CLEAN_EMPTIES_TOKEN_PAT = re.compile(r'\s+|[^\s{}\[\],]+|.', re.UNICODE)
+
     def parse(self, content, **kwargs):
         # Validate that content is JSON
         self.validate_content(content)
@@ -66,56 +72,71 @@ class JsonHandler(Handler):
         return self.transcriber.get_destination(), self.stringset
 
     def _extract(self, parsed, nest=None):
+        # Nested containers are walked depth-first with an explicit stack of
+        # item iterators rather than by recursing, so deeply nested files
+        # don't run into the recursion limit.
+        # The loop runs once per JSON value, so the names it uses are bound to
+        # locals up front
+        text_type, binary_type = six.text_type, six.binary_type
+        iter_extract_items = self._iter_extract_items
+        create_openstring = self._create_openstring
+        stringset_append = self.stringset.append
+
+        stack = [iter_extract_items(parsed, nest)]
+        while stack:
+            for key, value, value_position in stack[-1]:
+                # DumbJson only yields exact types, cheaper to compare against
+                # than going through `isinstance`
+                value_type = type(value)
+                if value_type is DumbJson:
+                    stack.append(iter_extract_items(value, key))
+                    break
+
+                elif value_type is text_type or value_type is binary_type:
+                    if not value.strip():
+                        continue
+
+                    openstring = create_openstring(key, value, value_position)
+                    if openstring:
+                        stringset_append(openstring)
+
+                else:
+                    # Ignore other JSON types (bools, nulls, numbers)
+                    pass
+            else:
+                stack.pop()
+
+    def _iter_extract_items(self, parsed, nest):
+        """Yield `(key, value, value_position)` for every item of `parsed`,
+        with `key` being the full key of the item, nesting included.
+        """
         if parsed.type == dict:
             for key, key_position, value, value_position in parsed:
                 key = self._escape_key(key)
                 if nest is not None:
-                    key = u"{}.{}".format(nest, key)
+                    key = nest + u"." + key
 
-                # 'key' should be unique
-                if key in self.existing_keys:
+                # 'key' should be unique, if adding it didn't grow the set it
+                # was already there. Saves a second hash table probe per key
+                existing_keys_count = len(self.existing_keys)
+                self.existing_keys.add(key)
+                if len(self.existing_keys) == existing_keys_count:
                     # Need this for line number
                     self.transcriber.copy_until(key_position)
                     raise ParseError(u"Duplicate string key ('{}') in line {}".
                                      format(key, self.transcriber.line_number))
-                self.existing_keys.add(key)
-
-                if isinstance(value, (six.binary_type, six.text_type)):
-                    if not value.strip():
-                        continue
-
-                    openstring = self._create_openstring(key, value,
-                                                         value_position)
-                    if openstring:
-                        self.stringset.append(openstring)
 
-                elif isinstance(value, DumbJson):
-                    self._extract(value, key)
-
-                else:
-                    # Ignore other JSON types (bools, nulls, numbers)
-                    pass
+                yield key, value, value_position
 
         elif parsed.type == list:
             for index, (item, item_position) in enumerate(parsed):
                 if nest is None:
-                    key = u"..{}..".format(index)
+                    key = u"..%d.." % index
                 else:
-                    key = u"{}..{}..".format(nest, index)
-                if isinstance(item, (six.binary_type, six.text_type)):
-                    if not item.strip():
-                        continue
+                    key = u"%s..%d.." % (nest, index)
 
-                    openstring = self._create_openstring(key, item,
-                                                         item_position)
-                    if openstring:
-                        self.stringset.append(openstring)
+                yield key, item, item_position
 
-                elif isinstance(item, DumbJson):
-                    self._extract(item, key)
-                else:
-                    # Ignore other JSON types (bools, nulls, numbers)
-                    pass
         else:
             raise ParseError("Invalid JSON")
 
@@ -189,26 +210,19 @@ class JsonHandler(Handler):
 
     def compile(self, template, stringset, **kwargs):
         # Lets play on the template first, we need it to not include the hashes
-        # that aren't in the stringset. For that we will create a new stringset
-        # which will have the hashes themselves as strings and compile against
-        # that. The compilation process will remove any string sections that
-        # are absent from the stringset. Next we will call `_clean_empties`
-        # from the template to clear out any `...,  ,...` or `...{ ,...`
-        # sequences left. The result will be used as the actual template for
-        # the compilation process
+        # that aren't in the stringset. For that we will compile against the
+        # stringset while putting back the hashes themselves instead of the
+        # translations (`is_real_stringset=False`). The compilation process
+        # will remove any string sections that are absent from the stringset.
+        # Next we will call `_clean_empties` from the template to clear out
+        # any `...,  ,...` or `...{ ,...` sequences left. This has to happen
+        # before the translations are inserted, since they may contain such
+        # sequences themselves. The result will be used as the actual template
+        # for the compilation process
 
         stringset = list(stringset)
 
-        fake_stringset = [
-            OpenString(openstring.key,
-                       openstring.template_replacement,
-                       order=openstring.order,
-                       pluralized=openstring.pluralized)
-            for openstring in stringset
-        ]
-        new_template = self._replace_translations(
-            template, fake_stringset, False
-        )
+        new_template = self._replace_translations(template, stringset, False)
         new_template = self._clean_empties(new_template)
 
         return self._replace_translations(new_template, stringset, True)
@@ -227,94 +241,109 @@ class JsonHandler(Handler):
         return self.transcriber.get_destination()
 
     def _insert(self, parsed, is_real_stringset):
-        if parsed.type == dict:
-            return self._insert_from_dict(parsed, is_real_stringset)
-        elif parsed.type == list:
-            return self._insert_from_list(parsed, is_real_stringset)
-
-    def _insert_item(self, value, value_position, is_real_stringset):
-        at_least_one = False
-
-        if isinstance(value, (six.binary_type, six.text_type)):
-            string = self._get_next_string()
-            string_exists = string is not None
-
-            templ_replacement = string.template_replacement \
-                if string_exists else None
-
-            # Pluralized string
-            if string_exists and string.pluralized \
-                    and templ_replacement in value:
-                at_least_one = True
-                self._insert_plural_string(
-                    value, value_position, string, is_real_stringset
-                )
-
-            # Regular string
-            elif string_exists and value == templ_replacement:
-                at_least_one = True
-                self._insert_regular_string(
-                    value, value_position, string, is_real_stringset
-                )
+        """Replace the hashes found in `parsed` and its nested containers,
+        removing the sections of the items that are not in the stringset.
 
-            else:
-                # Anything else: just remove the current section
-                self._copy_until_and_remove_section(
-                    value_position + len(value) + 1
-                )
+        The containers are walked depth-first with an explicit stack instead
+        of recursion. Each frame holds a container, an iterator over its items
+        and whether at least one of them was kept; containers left with no
+        items are removed altogether. Items are handled inline, this loop runs
+        once for every value in the template.
 
-        elif isinstance(value, DumbJson):
-            items_still_left = self._insert(value, is_real_stringset)
+        :return: whether at least one item of `parsed` was kept
+        """
+        stack = [[parsed, self._iter_insert_items(parsed), False]]
+        while True:
+            frame = stack[-1]
+            for value, value_position in frame[1]:
+                value_type = type(value)
+                if value_type is DumbJson:
+                    stack.append(
+                        [value, self._iter_insert_items(value), False]
+                    )
+                    break
+
+                if (value_type is not six.text_type and
+                        value_type is not six.binary_type):
+                    # 'value' is a python value allowed by JSON (integer,
+                    # boolean, null), skip it
+                    frame[2] = True
+                    continue
+
+                string = self._get_next_string()
+                if string is None:
+                    # Remove the current section
+                    self._copy_until_and_remove_section(
+                        value_position + len(value) + 1
+                    )
+                    continue
+
+                templ_replacement = string.template_replacement
+                replacement_pos = (value.find(templ_replacement)
+                                   if string.pluralized else -1)
+
+                # Pluralized string
+                if replacement_pos != -1:
+                    frame[2] = True
+                    self._insert_plural_string(
+                        value, value_position, replacement_pos, string,
+                        is_real_stringset
+                    )
+
+                # Regular string
+                elif value == templ_replacement:
+                    frame[2] = True
+                    self._insert_regular_string(
+                        value, value_position, string, is_real_stringset
+                    )
 
-            if not items_still_left:
-                self._copy_until_and_remove_section(value.end + 1)
+                else:
+                    # Anything else: just remove the current section
+                    self._copy_until_and_remove_section(
+                        value_position + len(value) + 1
+                    )
             else:
-                at_least_one = True
+                container, _, at_least_one = stack.pop()
+                if not stack:
+                    return at_least_one
 
-        else:
-            # 'value' is a python value allowed by JSON (integer,
-            # boolean, null), skip it
-            at_least_one = True
-
-        return at_least_one
+                if at_least_one:
+                    stack[-1][2] = True
+                else:
+                    self._copy_until_and_remove_section(container.end + 1)
 
-    def _insert_from_dict(self, parsed, is_real_stringset):
-        at_least_one = False
+    def _iter_insert_items(self, parsed):
+        if parsed.type == dict:
+            return self._iter_insert_dict_items(parsed)
+        elif parsed.type == list:
+            return self._iter_insert_list_items(parsed)
 
+    def _iter_insert_dict_items(self, parsed):
+        """Yield `(value, value_position)` for every item of the `parsed` dict,
+        after marking the start of its section.
+        """
         for key, key_position, value, value_position in parsed:
-
             self.transcriber.copy_until(key_position - 1)
             self.transcriber.mark_section_start()
 
-            tmp_at_least_one = self._insert_item(
-                value, value_position, is_real_stringset
-            )
-
-            if tmp_at_least_one:
-                at_least_one = True
-
-        return at_least_one
-
-    def _insert_from_list(self, parsed, is_real_stringset):
-        at_least_one = False
+            yield value, value_position
 
+    def _iter_insert_list_items(self, parsed):
+        """Yield `(value, value_position)` for every item of the `parsed` list,
+        after marking the start of its section.
+        """
         for value, value_position in parsed:
             self.transcriber.copy_until(value_position - 1)
             self.transcriber.mark_section_start()
 
-            tmp_at_least_one = self._insert_item(
-                value, value_position, is_real_stringset
-            )
-
-            if tmp_at_least_one:
-                at_least_one = True
+            yield value, value_position
 
-        return at_least_one
-
-    def _insert_plural_string(self, value, value_position, string,
-                              is_real_stringset):
+    def _insert_plural_string(self, value, value_position, replacement_pos,
+                              string, is_real_stringset):
+        """Replace the hash of a pluralized string, found at `replacement_pos`
+        inside `value`.
+        """
         templ_replacement = string.template_replacement
-        replacement_pos = value.find(templ_replacement)
 
         if is_real_stringset:
             replacement = ICUCompiler().serialize_strings(string.string,
@@ -335,8 +364,13 @@ class JsonHandler(Handler):
 
     def _insert_regular_string(self, value, value_position, string,
                                is_real_stringset):
+        if is_real_stringset:
+            replacement = string.string
+        else:
+            replacement = string.template_replacement
+
         self.transcriber.copy_until(value_position)
-        self.transcriber.add(string.string)
+        self.transcriber.add(replacement)
         self.transcriber.skip(len(value))
         self.stringset_index += 1
 
@@ -368,46 +402,32 @@ class JsonHandler(Handler):
                 '{, "a": "b", "c": "d"}' -> '{"a": "b", "c": "d"}'
                 '["a", , "b"]' -> '["a", "b"]'
         """
-        while True:
-            # First key-value of a dict was removed
-            match = re.search(r'{\s*,', compiled)
-            if match:
-                compiled = u"{}{{{}".format(compiled[:match.start()],
-                                            compiled[match.end():])
-                continue
-
-            # Last key-value of a dict was removed
-            match = re.search(r',\s*}', compiled)
-            if match:
-                compiled = u"{}}}{}".format(compiled[:match.start()],
-                                            compiled[match.end():])
-                continue
-
-            # First item of a list was removed
-            match = re.search(r'\[\s*,', compiled)
-            if match:
-                compiled = u"{}[{}".format(compiled[:match.start()],
-                                           compiled[match.end():])
-                continue
-
-            # Last item of a list was removed
-            match = re.search(r',\s*\]', compiled)
-            if match:
-                compiled = u"{}]{}".format(compiled[:match.start()],
-                                           compiled[match.end():])
-                continue
-
-            # Intermediate key-value of a dict or list was removed
-            match = re.search(r',\s*,', compiled)
-            if match:
-                compiled = u"{},{}".format(compiled[:match.start()],
-                                           compiled[match.end():])
-                continue
-
-            # No substitutions happened, break
-            break
+        if not self.LEFTOVER_COMMA_PAT.search(compiled):
+            return compiled
+
+        # Single pass over the tokens, comparing each comma or closing bracket
+        # against the last non-whitespace token kept so far
+        tokens = []
+        for token in self.CLEAN_EMPTIES_TOKEN_PAT.findall(compiled):
+            if token in (u',', u'}', u']'):
+                last = len(tokens) - 1
+                if last >= 0 and tokens[last].isspace():
+                    last -= 1
+                previous = tokens[last] if last >= 0 else None
+
+                if token == u',':
+                    if previous in (u'{', u'[', u','):
+                        # First or intermediate item of a dict or list was
+                        # removed, drop the comma and the whitespace before it
+                        del tokens[last + 1:]
+                        continue
+                elif previous == u',':
+                    # Last item of a dict or list was removed, drop the
+                    # comma and the whitespace after it
+                    del tokens[last:]
+            tokens.append(token)
 
-        return compiled
+        return u''.join(tokens)
 
     def _get_next_string(self):
         try:
@@ -238,7 +238,7 @@ class StringsDictHandler(Handler):
             # If empty <string> tag keep it. It is either a placeholder which
             # should be kept or it is missing plurals and we will raise a
             # ParseError on self._create_string.
-            if value_tag.content and value_tag.content.strip() != "":
+            if value_tag.content and not value_tag.content.isspace():
                 self.transcriber.skip_until(value_tag.end)
             else:
                 self.transcriber.copy_until(value_tag.tail_position)
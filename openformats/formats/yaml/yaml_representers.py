@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
-import six
 import yaml
 
 from openformats.formats.yaml.constants import (YAML_DICT_ID, YAML_LIST_ID,
@@ -45,14 +44,14 @@ def flow_list_representer(dumper, data):
 
 
 def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(six.iteritems(data))
+    return dumper.represent_dict(data.items())
 
 
 def block_style_ordered_dict_representer(dumper, data):
-    return dumper.represent_mapping(YAML_DICT_ID, six.iteritems(data),
+    return dumper.represent_mapping(YAML_DICT_ID, data.items(),
                                     flow_style=False)
 
 
 def flow_style_ordered_dict_representer(dumper, data):
-    return dumper.represent_mapping(YAML_DICT_ID, six.iteritems(data),
+    return dumper.represent_mapping(YAML_DICT_ID, data.items(),
                                     flow_style=True)
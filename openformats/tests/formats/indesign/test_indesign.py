@@ -197,6 +197,30 @@ class InDesignTestCase(unittest.TestCase):
         self.assertEqual(first_compiled_story, expected_first_compiled_story)
         self.assertEqual(second_compiled_story, expected_second_compiled_story)
 
+    def test_compile_story_does_not_search_backwards(self):
+        simple_story_template = u"""
+            <Story>
+              <Content>9a1c7ee2c7ce38d4bbbaf29ab9f2ac1e_tr</Content>
+              <Content>3afcdbfeb6ecfbdd0ba628696e3cc163_tr</Content>
+            </Story>
+        """
+        simple_compiled_story = u"""
+            <Story>
+              <Content></Content>
+              <Content>Some string 2</Content>
+            </Story>
+        """
+        handler = self.HANDLER_CLASS()
+        handler.stringset = [
+            OpenString(u"1", u"Some string 2", order=1),
+            OpenString(u"0", u"Some string 1", order=0),
+        ]
+
+        compiled_story = handler._compile_story(simple_story_template)
+        self.assertEqual(compiled_story, simple_compiled_story)
+        self.assertEqual([string.key for string in handler.stringset],
+                         [u"0"])
+
     def test_compile_story_with_amps(self):
         regular = OpenString('0', u"hello world", order=0)
         with_amp = OpenString('1', u"hello &world", order=1)
@@ -115,6 +115,18 @@ class JsonTestCase(CommonFormatTestMixin, unittest.TestCase):
         self.assertEqual(stringset[1].__dict__, openstring2.__dict__)
         self.assertEqual(compiled, '{"a": "%s"}' % string1)
 
+    def test_clean_empties(self):
+        for dirty, clean in (
+                ('{"a": "b", ,"c": "d"}', '{"a": "b","c": "d"}'),
+                ('{, "a": "b", "c": "d"}', '{ "a": "b", "c": "d"}'),
+                ('{"a": "b", "c": "d", }', '{"a": "b", "c": "d"}'),
+                ('["a", , "b"]', '["a", "b"]'),
+                ('[ ,\n  , "a"]', '[ "a"]'),
+                ('{"a": [\n  ,\n  \n], "b": 1}', '{"a": [\n  \n], "b": 1}'),
+                ('{"a": {"b": "c", }, , }', '{"a": {"b": "c"}}'),
+                ('{"a": "b"}', '{"a": "b"}')):
+            self.assertEqual(self.handler._clean_empties(dirty), clean)
+
     def test_compile_skips_removed_strings_for_lists(self):
         string1 = self.random_string
         string2 = generate_random_string()
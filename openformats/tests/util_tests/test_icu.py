@@ -2,6 +2,7 @@
 
 import unittest
 
+from openformats.exceptions import ParseError
 from openformats.strings import OpenString
 from openformats.utils.icu import (ICUCompiler, ICUParser, ICUString,
                                    normalize_plural_rule, PLURAL_FORMAT_NUMERIC,
@@ -112,6 +113,35 @@ class ICUParserTestCase(unittest.TestCase):
         icu_str = parser.parse('key', u'{count, plural, =1 {μπάλα} other {μπάλες}}')
         self.assertIsNone(icu_str)
 
+    def test_nested_braces_and_quotes(self):
+        """Braces inside plural contents are balanced, single quotes are
+        treated as regular characters."""
+        parser = ICUParser()
+        icu_str = parser.parse(
+            'key',
+            u"{count, plural, one {I've {cnt} {a} b} other {'{cnt}' {c}}}"
+        )
+        self.assertDictEqual(
+            icu_str.strings_by_rule,
+            {1: u"I've {cnt} {a} b", 5: u"'{cnt}' {c}"}
+        )
+
+    def test_invalid_plural_rule(self):
+        parser = ICUParser()
+        self.assertRaisesRegexp(
+            ParseError, 'Invalid plural rule\\(s\\): "foo"',
+            parser.parse,
+            'key', u'{count, plural, foo {a} other {b}}'
+        )
+
+    def test_unbalanced_braces(self):
+        parser = ICUParser()
+        self.assertRaisesRegexp(
+            ParseError, 'Invalid format of pluralized entry',
+            parser.parse,
+            'key', u'{count, plural, one {a {b} other {c}}'
+        )
+
     def test_plural_rule_normalization(self):
         """The the conversions made by the normalize_plural_rule() function."""
         self.assertEqual(normalize_plural_rule('=0'), 'zero')
@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+
 import six
 
 from .utils.newlines import find_newline_type, force_newline_type
@@ -80,6 +82,10 @@ class Transcriber(object):
         self.destination = []
         self.ptr = 0
 
+        # Positions of the SectionStart markers still in 'destination', in
+        # ascending order
+        self.section_starts = []
+
         self.newline_count = 0
 
         # Handle newlines
@@ -108,18 +114,19 @@ class Transcriber(object):
         self.destination.append(text)
 
     def skip(self, offset):
-        chunk = self.source[self.ptr:self.ptr + offset]
-        self.newline_count += chunk.count('\n')
+        # Count in place, skipped text doesn't need to be sliced out
+        self.newline_count += self.source.count('\n', self.ptr,
+                                                self.ptr + offset)
 
         self.ptr += offset
 
     def skip_until(self, end):
-        chunk = self.source[self.ptr:end]
-        self.newline_count += chunk.count('\n')
+        self.newline_count += self.source.count('\n', self.ptr, end)
 
         self.ptr = end
 
     def mark_section_start(self):
+        self.section_starts.append(len(self.destination))
         self.destination.append(self.SectionStart)
 
     def mark_section_end(self):
@@ -201,14 +208,17 @@ class Transcriber(object):
                                   section_end_position + 1):
             self.destination[i] = None
 
+        # Forget the section starts that were just removed
+        del self.section_starts[
+            bisect_left(self.section_starts, section_start_position):
+            bisect_right(self.section_starts, section_end_position)
+        ]
+
     def _find_last_section_start(self, place=0):
-        count = place
-        for i, segment in enumerate(self.destination[::-1], start=1):
-            if segment == self.SectionStart:
-                if count == 0:
-                    return len(self.destination) - i
-                else:
-                    count -= 1
+        try:
+            return self.section_starts[-1 - place]
+        except IndexError:
+            return None
 
     @property
     def line_number(self):
@@ -243,10 +253,14 @@ class Transcriber(object):
         return self.newline_count + 1
 
     def get_destination(self, enforce_newline_type=None):
-        return "".join([self.edit_newlines(chunk, enforce_newline_type)
-                        for chunk in self.destination
-                        if chunk not in (self.SectionStart, self.SectionEnd,
-                                         None)])
+        # Join first and render the newlines once, over the whole result,
+        # instead of once per chunk
+        section_start, section_end = self.SectionStart, self.SectionEnd
+        destination = "".join([chunk for chunk in self.destination
+                               if chunk is not None and
+                               chunk is not section_start and
+                               chunk is not section_end])
+        return self.edit_newlines(destination, enforce_newline_type)
 
     def edit_newlines(self, chunk, enforce_newline_type=None):
         r"""
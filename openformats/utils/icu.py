@@ -1,6 +1,5 @@
 import re
 
-import pyparsing
 import six
 
 from openformats.exceptions import ParseError
@@ -106,7 +105,7 @@ class ICUString(object):
                 normalize_plural_rule(plurality_str)
             ): (
                 PLURAL_FORMAT_NUMERIC
-                if plurality_str in six.iterkeys(RULE_MAPPING)
+                if plurality_str in RULE_MAPPING
                 else PLURAL_FORMAT_STRING
             )
             for plurality_str, content in self.string_info
@@ -153,6 +152,20 @@ class ICUParser(object):
     """
 
     PLURAL_ARG = 'plural'
+    MESSAGE_PAT = re.compile(ensure_unicode(
+        r'\s*{\s*([A-Za-z-_\d]+)\s*,\s*([A-Za-z_]+)\s*,\s*(.*)}\s*'
+    ))
+
+    # The beginning of a '<plurality_rule_str> {<content>}' item, up to and
+    # including the opening brace
+    PLURAL_ITEM_PAT = re.compile(r'[=A-Za-z0-9]+[ \t\r\n]*{')
+    VALID_PLURAL_ITEM_PAT = re.compile(r'(?:{})[ \t\r\n]*{{'.format(
+        '|'.join(re.escape(rule) for rule in SUPPORTED_PLURAL_RULES)
+    ))
+    NUMERIC_PLURAL_ITEM_PAT = re.compile(r'(?:{})[ \t\r\n]*{{'.format(
+        '|'.join(re.escape(rule) for rule in NUMERIC_RULES)
+    ))
+    BRACE_PAT = re.compile(r'[{}]')
 
     def __init__(self, allow_numeric_plural_values=True):
         """Constructor.
@@ -197,12 +210,12 @@ class ICUParser(object):
         :raise ParseError: if the given string looks a lot like
             an ICU plural string but has an invalid structure
         """
-        matches = re.match(
-            ensure_unicode(
-                r'\s*{\s*([A-Za-z-_\d]+)\s*,\s*([A-Za-z_]+)\s*,\s*(.*)}\s*'
-            ),
-            value
-        )
+        # Most strings are not ICU messages at all, there is no need to run
+        # the regex on those that could never match it
+        if not value.lstrip().startswith(u'{'):
+            return None
+
+        matches = self.MESSAGE_PAT.match(value)
         if not matches:
             return None
 
@@ -210,23 +223,26 @@ class ICUParser(object):
 
         if argument == ICUParser.PLURAL_ARG:
             return self._parse_pluralized_string(
-                key, keyword, value, serialized_strings,
+                key, value, serialized_strings, matches.start(3),
             )
 
         return None
 
-    def _parse_pluralized_string(self, key, keyword, value, serialized_strings):
+    def _parse_pluralized_string(self, key, value, serialized_strings,
+                                 serialized_position):
         """
         Parse `serialized_strings` in order to find and return all included
         pluralized strings.
 
         :param key: the string key
-        :param keyword: the message key, e.g. `item_count` in:
+        :param value: the whole ICU message, e.g.
             '{ item_count, plural, one { {cnt} tip } other { {cnt} tips } }'
         :param serialized_strings: the plurals in the form of multiple
             occurrences of the following (whitespace irrelevant):
             '<plurality_rule_str> { <content> }',
             e.g. 'one { I ate {cnt} apple. } other { I ate {cnt} apples. }'
+        :param serialized_position: the position of `serialized_strings`
+            inside `value`
         :return: A pluralized ICUString instance or None
         """
         if not self.allow_numeric_plural_values:
@@ -239,12 +255,9 @@ class ICUParser(object):
             # for backwards compatibility: if it's True, and the string is
             # following the =N syntax, we need to stop parsing this string
             # as pluralized and return None.
-            equality_item = (
-                pyparsing.oneOf(NUMERIC_RULES) +
-                pyparsing.nestedExpr('{', '}', ignoreExpr=pyparsing.Literal("'"))
+            equality_matches = self._find_plural_items(
+                self.NUMERIC_PLURAL_ITEM_PAT, serialized_strings
             )
-            equality_matches = pyparsing.originalTextFor(equality_item)\
-                .searchString(serialized_strings)
 
             # If any match is found using this syntax, do not parse this
             # as pluralized
@@ -254,35 +267,18 @@ class ICUParser(object):
         # Each item should be like '<proper_plurality_rule_str> {<content>}'
         # Nested braces ({}) inside <content> are allowed.
         #
-        # Note:
-        # Be sure to ignore single quotes ('), otherwise strings that include
-        # one quote in one plural and another one in another plural, will be
-        # parsed as pluralized but with less rules than they actually have.
-        # (matching will actually include content from multiple rules combined,
-        # instead of separating the content per rule). This seems like a
-        # pyparsing bug. Any other character that could be a potential
-        # separator doesn't seem cause any problem.
-        valid_plural_item = (
-            pyparsing.oneOf(SUPPORTED_PLURAL_RULES) +
-            pyparsing.nestedExpr('{', '}', ignoreExpr=pyparsing.Literal("'"))
+        # Create a list of the positions of serialized plural items, e.g.
+        # [(0, 25)] for 'one { I ate {count} apple. }'
+        valid_matches = self._find_plural_items(
+            self.VALID_PLURAL_ITEM_PAT, serialized_strings
         )
 
-        # Create a list of serialized plural items, e.g.:
-        # ['one { I ate {count} apple. }']
-        valid_matches = pyparsing.originalTextFor(valid_plural_item)\
-            .searchString(serialized_strings)
-
         # We need to make sure that the plural rules are valid.
         # Therefore, we also match any <alphanumeric> {<content>} string
         # and see if there are differences compared to the valid results
         # we got above.
-        any_plural_item = (
-            pyparsing.Word('=' + pyparsing.alphanums) +
-            pyparsing.nestedExpr('{', '}', ignoreExpr=pyparsing.Literal("'"))
-        )
-
-        all_matches = pyparsing.originalTextFor(any_plural_item).searchString(
-            serialized_strings
+        all_matches = self._find_plural_items(
+            self.PLURAL_ITEM_PAT, serialized_strings
         )
 
         self._validate_plural_content_format(
@@ -293,13 +289,13 @@ class ICUParser(object):
         # If not, an error will be raised
         if len(valid_matches) != len(all_matches):
             self._handle_invalid_plural_format(
-                serialized_strings, any_plural_item, key, value
+                serialized_strings, all_matches, key, value
             )
 
         # Create a list of tuples [(plurality_str, content_with_braces)]
         all_strings_list = [
-            self._parse_plural_content(match[0])
-            for match in valid_matches
+            self._parse_plural_content(serialized_strings[start:end])
+            for start, end in valid_matches
         ]
 
         icu_string = ICUString(key, all_strings_list, pluralized=True)
@@ -310,16 +306,11 @@ class ICUParser(object):
         # e.g. in { item_count, plural, other {You have {file_count} files.} }
         # `item_count` is a string set by the user, it's not a standard.
         # We'll keep everything up to the comma that follows the 'plural'
-        # argument.
-        current_pos = value.index(keyword) + len(keyword)
-        current_pos = value.index(ICUParser.PLURAL_ARG, current_pos)\
-            + len(ICUParser.PLURAL_ARG)
-        current_pos = value.index(',', current_pos) + len(',')
-
-        # We want to preserve the original document as much as possible,
-        # so we'll add any whitespace between the comma and the
-        # first plurality rule, e.g. 'one'
-        current_pos = value.index(all_strings_list[0][0], current_pos)
+        # argument, and since we want to preserve the original document as
+        # much as possible, any whitespace between that comma and the first
+        # plurality rule, e.g. 'one'. `MESSAGE_PAT` already skipped all of
+        # that when it matched `serialized_strings`.
+        current_pos = value.index(all_strings_list[0][0], serialized_position)
 
         # Also include whitespace between the last two closing braces
         second_last_closing_brace = value.rfind('}', 0, value.rfind('}')) + 1
@@ -330,6 +321,47 @@ class ICUParser(object):
 
         return icu_string
 
+    def _find_plural_items(self, item_pat, serialized_strings):
+        """
+        Find all '<plurality_rule_str> {<content>}' items in the given string.
+
+        Items are searched left to right, each one starting where the
+        previous one ended. An item that starts with `item_pat` but whose
+        braces are not balanced is not an item; searching resumes right
+        after its first character.
+
+        :param item_pat: a compiled pattern that matches the beginning of an
+            item up to (and including) the opening brace
+        :param serialized_strings: the string to search in
+        :return: a list of (start, end) positions of the items found
+        :rtype: list
+        """
+        matches = []
+        position = 0
+        while True:
+            item_start = item_pat.search(serialized_strings, position)
+            if item_start is None:
+                return matches
+
+            # Find the brace that closes the one `item_pat` ended with
+            item_end = None
+            depth = 0
+            for brace in self.BRACE_PAT.finditer(serialized_strings,
+                                                 item_start.end() - 1):
+                if brace.group() == '{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        item_end = brace.end()
+                        break
+
+            if item_end is None:
+                position = item_start.start() + 1
+            else:
+                matches.append((item_start.start(), item_end))
+                position = item_end
+
     def _validate_plural_content_format(self, key, serialized_strings, all_matches):
         """
         Make sure the serialized content is properly formatted
@@ -339,15 +371,20 @@ class ICUParser(object):
         :param serialized_strings: the part of the value that holds the
             string information only, e.g.
             zero {...} one {...} other {...}
-        :param all_matches: a pyparsing element that matches all strings
+        :param all_matches: the (start, end) positions of all strings
             formatted like '<alphanumeric> {...}'
 
         :raise ParseError: if the given string has an invalid structure
         """
-        # Replace all matches with spaces in the given string.
-        remaining_str = serialized_strings
-        for match in all_matches:
-            remaining_str = remaining_str.replace(match[0], '')
+        # Keep only what lies between the matches. They are sorted and don't
+        # overlap, so this is a single walk over the given string
+        gaps = []
+        previous_end = 0
+        for start, end in all_matches:
+            gaps.append(serialized_strings[previous_end:start])
+            previous_end = end
+        gaps.append(serialized_strings[previous_end:])
+        remaining_str = ''.join(gaps)
 
         # Then make sure all whitespace is removed as well
         # Special characters may be present with double backslashes,
@@ -371,23 +408,25 @@ class ICUParser(object):
             )
 
     def _handle_invalid_plural_format(self, serialized_strings,
-                                      any_plural_item, key, value):
+                                      all_matches, key, value):
         """
         Raise a descriptive ParseError exception when the serialized
         translation string of a plural string is not properly formatted.
 
         :param serialized_strings:
-        :param any_plural_item: a forgiving pyparsing element that matches all
-            strings formatted like '<alphanumeric> {...}'
+        :param all_matches: the (start, end) positions of all strings
+            formatted like '<alphanumeric> {...}'
 
         :raise: ParseError
         """
-        all_matches = any_plural_item.searchString(serialized_strings)
-        all_keys = [match[0] for match in all_matches]
+        all_keys = [
+            self._parse_plural_content(serialized_strings[start:end])[0]
+            for start, end in all_matches
+        ]
 
         invalid_rules = [
             rule for rule in all_keys
-            if rule not in six.iterkeys(Handler._RULES_ATOI)
+            if rule not in Handler._RULES_ATOI
         ]
         raise ParseError(
             'Invalid plural rule(s): "{}" in pluralized entry '
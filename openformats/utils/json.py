@@ -66,6 +66,19 @@ class DumbJson(object):
     CARRIAGE_RETURN = u'\r'
     TAB = u'\t'
 
+    # The first non-empty value after a position: a dict, list or string
+    # opening symbol, true/false/null or a number
+    VALUE_PAT = re.compile(
+        r'(?P<spaces>\s*)(?P<value>[{\["]|true|false|null|-?\d+e-?\d+|'
+        r'-?\d+\.\d+|-?\d+)'
+    )
+    FIRST_NON_EMPTY_PAT = re.compile(r'\s*.')
+    # Whitespace allowed before the symbols `_find_next` is looking for
+    WHITESPACE_PAT = re.compile(r'\s*', re.UNICODE)
+    # The contents of a string up to and including its closing double quotes;
+    # a backslash escapes whatever follows it
+    STRING_CONTENT_PAT = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
     def __init__(self, source, start=0):
         self.source = source
         self._end = None
@@ -149,10 +162,10 @@ class DumbJson(object):
         start = self.start + 1
 
         # Maybe it's an empty list
-        match = re.search(r'^\s*.', self.source[start:])
+        match = self.FIRST_NON_EMPTY_PAT.match(self.source, start)
         if match:
             if match.group()[-1] == "]":
-                self.end = start + match.end() - 1
+                self.end = match.end() - 1
                 return
 
         while True:
@@ -195,30 +208,36 @@ class DumbJson(object):
                 break
 
     def _find_next(self, symbols, start=0, require_whitespace=True):
-        symbols = {s for s in symbols}
-        after_backslash = False
-        for ptr in six.moves.xrange(start, len(self.source)):
-            candidate = self.source[ptr]
-            if candidate == '\\':
-                after_backslash = not after_backslash
-            if candidate in symbols:
-                if candidate == self.DOUBLE_QUOTES and after_backslash:
-                    after_backslash = False
-                    continue
-                return candidate, ptr
-            if candidate != '\\':
-                after_backslash = False
-            if require_whitespace and not candidate.isspace():
-                newline_count = self.source.count(self.NEWLINE, 0, ptr)
-                raise ValueError(
-                    u"Was expecting whitespace or one of `{symbols}` on line "
-                    u"{line_no}, found `{candidate}` instead".format(
-                        symbols=''.join(sorted(symbols)),
-                        line_no=newline_count + 1,
-                        candidate=candidate,
-                    )
-                )
-        return None, None
+        """ Find the next occurrence of any of `symbols` after `start` and
+            return it along with its position, or `(None, None)` if the end of
+            the source is reached.
+
+            - If `require_whitespace` is set, only whitespace may precede the
+              symbol, otherwise a ValueError is raised
+            - Otherwise, `symbols` should be the double quotes closing a
+              string; escaped double quotes are skipped
+        """
+        if not require_whitespace:
+            match = self.STRING_CONTENT_PAT.match(self.source, start)
+            if match is None:
+                return None, None
+            return self.DOUBLE_QUOTES, match.end() - 1
+
+        ptr = self.WHITESPACE_PAT.match(self.source, start).end()
+        if ptr >= len(self.source):
+            return None, None
+        candidate = self.source[ptr]
+        if candidate in symbols:
+            return candidate, ptr
+        newline_count = self.source.count(self.NEWLINE, 0, ptr)
+        raise ValueError(
+            u"Was expecting whitespace or one of `{symbols}` on line "
+            u"{line_no}, found `{candidate}` instead".format(
+                symbols=''.join(sorted(set(symbols))),
+                line_no=newline_count + 1,
+                candidate=candidate,
+            )
+        )
 
     def _process_value(self, start):
         """ A variation of _find_next. If the next non-empty character after
@@ -237,17 +256,7 @@ class DumbJson(object):
             - value_start_p: where the value, whatever it is, is encountered
         """
 
-        # Lets construct a regular expression to find the first non-empty char
-        value_pat = r'{dict_list_string}|{true_false_null}|{e_notation}|'\
-            r'{_float}|{integer}'.format(
-                dict_list_string=r'[{\["]',
-                true_false_null=r'true|false|null',
-                e_notation=r'-?\d+e-?\d+',
-                _float=r'-?\d+\.\d+',
-                integer=r'-?\d+',
-            )
-        first_non_empty = r'^(?P<spaces>\s*)(?P<value>{})'.format(value_pat)
-        match = re.search(first_non_empty, self.source[start:])
+        match = self.VALUE_PAT.match(self.source, start)
         # We probably found a match, otherwise this is not JSON
         if match:
             spaces, value = match.groups()
@@ -300,109 +309,51 @@ class DumbJson(object):
         return [(found.get(key, (None, None))) for key in keys]
 
 
+_ESCAPE_TABLE = {
+    ord(DumbJson.DOUBLE_QUOTES): DumbJson.BACKSLASH + DumbJson.DOUBLE_QUOTES,
+    ord(DumbJson.BACKSLASH): DumbJson.BACKSLASH + DumbJson.BACKSLASH,
+    ord(DumbJson.BACKSPACE): DumbJson.BACKSLASH + u'b',
+    ord(DumbJson.FORMFEED): DumbJson.BACKSLASH + u'f',
+    ord(DumbJson.NEWLINE): DumbJson.BACKSLASH + u'n',
+    ord(DumbJson.CARRIAGE_RETURN): DumbJson.BACKSLASH + u'r',
+    ord(DumbJson.TAB): DumbJson.BACKSLASH + u't',
+}
+
+
 def escape(string):
-    return u''.join(_escape_generator(string))
+    return string.translate(_ESCAPE_TABLE)
     # btw, this seems equivalent to
     # return json.dumps(string, ensure_ascii=False)[1:-1]
 
 
-def _escape_generator(string):
-    for symbol in string:
-        if symbol == DumbJson.DOUBLE_QUOTES:
-            yield DumbJson.BACKSLASH
-            yield DumbJson.DOUBLE_QUOTES
-        elif symbol == DumbJson.BACKSLASH:
-            yield DumbJson.BACKSLASH
-            yield DumbJson.BACKSLASH
-        elif symbol == DumbJson.BACKSPACE:
-            yield DumbJson.BACKSLASH
-            yield u'b'
-        elif symbol == DumbJson.FORMFEED:
-            yield DumbJson.BACKSLASH
-            yield u'f'
-        elif symbol == DumbJson.NEWLINE:
-            yield DumbJson.BACKSLASH
-            yield u'n'
-        elif symbol == DumbJson.CARRIAGE_RETURN:
-            yield DumbJson.BACKSLASH
-            yield u'r'
-        elif symbol == DumbJson.TAB:
-            yield DumbJson.BACKSLASH
-            yield u't'
-        else:
-            yield symbol
+_UNESCAPE_PAT = re.compile(r'\\(?:(["/\\bfnrt])|u([0-9a-fA-F]{4}))')
+_UNESCAPE_TABLE = {
+    DumbJson.DOUBLE_QUOTES: DumbJson.DOUBLE_QUOTES,
+    DumbJson.FORWARD_SLASH: DumbJson.FORWARD_SLASH,
+    DumbJson.BACKSLASH: DumbJson.BACKSLASH,
+    u'b': DumbJson.BACKSPACE,
+    u'f': DumbJson.FORMFEED,
+    u'n': DumbJson.NEWLINE,
+    u'r': DumbJson.CARRIAGE_RETURN,
+    u't': DumbJson.TAB,
+}
+
+
+def _unescape_match(match):
+    symbol, unicode_hex = match.groups()
+    if symbol is not None:
+        return _UNESCAPE_TABLE[symbol]
+    return six.unichr(int(unicode_hex, 16))
 
 
 def unescape(string):
-    return u''.join(_unescape_generator(string))
+    # Backslashes that don't start a valid escape sequence are left as they
+    # are
+    return _UNESCAPE_PAT.sub(_unescape_match, string)
     # btw, this seems equivalent to
     # return json.loads(u'"{}"'.format(string))
 
 
-def _unescape_generator(string):
-    # I don't like this aldschool approach, but we may have to rewind a bit
-    ptr = 0
-    while True:
-        if ptr >= len(string):
-            break
-
-        symbol = string[ptr]
-
-        if symbol != DumbJson.BACKSLASH:
-            yield symbol
-            ptr += 1
-            continue
-
-        try:
-            next_symbol = string[ptr + 1]
-        except IndexError:
-            yield DumbJson.BACKSLASH
-            ptr += 1
-            continue
-
-        if next_symbol in (DumbJson.DOUBLE_QUOTES, DumbJson.FORWARD_SLASH,
-                           DumbJson.BACKSLASH):
-            yield next_symbol
-            ptr += 2
-        elif next_symbol == u'b':
-            yield DumbJson.BACKSPACE
-            ptr += 2
-        elif next_symbol == u'f':
-            yield DumbJson.FORMFEED
-            ptr += 2
-        elif next_symbol == u'n':
-            yield DumbJson.NEWLINE
-            ptr += 2
-        elif next_symbol == u'r':
-            yield DumbJson.CARRIAGE_RETURN
-            ptr += 2
-        elif next_symbol == u't':
-            yield DumbJson.TAB
-            ptr += 2
-        elif next_symbol == u'u':
-            unicode_escaped = string[ptr:ptr + 6]
-            try:
-                unescaped = unicode_escaped.\
-                    encode('ascii').\
-                    decode('unicode-escape')
-            except Exception:
-                yield DumbJson.BACKSLASH
-                yield u'u'
-                ptr += 2
-                continue
-            if len(unescaped) != 1:
-                yield DumbJson.BACKSLASH
-                yield u'u'
-                ptr += 2
-                continue
-            yield unescaped
-            ptr += 6
-
-        else:
-            yield symbol
-            ptr += 1
-
-
 for symbol in (DumbJson.BACKSLASH, DumbJson.DOUBLE_QUOTES,
                DumbJson.FORWARD_SLASH, DumbJson.BACKSPACE, DumbJson.FORMFEED,
                DumbJson.NEWLINE, DumbJson.CARRIAGE_RETURN, DumbJson.TAB):
@@ -1,5 +1,4 @@
 import re
-from itertools import count
 
 import six
 
@@ -39,60 +38,89 @@ def escape(string, inline_tags, escape_text):
 
 
 def _escape_tag(root, transcriber, inline_tags, escape_text):
-    if root.text is None:
-        # This is a single tag, eg <br />
-        if root.tag in inline_tags:
-            transcriber.copy_until(root.tail_position)
+    # Nested tags are walked depth-first with an explicit stack of
+    # `(tag, iterator over its children)` rather than by recursing, so deeply
+    # nested strings don't run into the recursion limit
+    if not _escape_opening_tag(root, transcriber, inline_tags, escape_text):
+        return
+    stack = [(root, iter(root))]
+    while stack:
+        tag, children = stack[-1]
+        for child in children:
+            if _escape_opening_tag(child, transcriber, inline_tags,
+                                   escape_text):
+                stack.append((child, iter(child)))
+                break
         else:
-            transcriber.add(escape_text(
-                transcriber.source[root.position:root.tail_position]
-            ))
-            transcriber.skip_until(root.tail_position)
+            stack.pop()
+            _escape_closing_tag(tag, transcriber, inline_tags, escape_text)
 
-    else:
-        # Opening tag
-        if root.tag in inline_tags:
-            # root: <out> first <in> middle </in> last </out> tail
-            # ptr:       ^
-            transcriber.copy_until(root.text_position)
-        else:
-            # Lets escape the opening tag
-            transcriber.add(escape_text(
-                transcriber.source[root.position:root.text_position]
-            ))
-            # root: <out> first <in> middle </in> last </out> tail
-            # ptr:       ^
-            transcriber.skip_until(root.text_position)
-
-        # Content
-        transcriber.add(escape_text(root.text))
-        # root: <out> first <in> middle </in> last </out> tail
-        # ptr:              ^
-        transcriber.skip(len(root.text))
-
-        # Inner tags
-        for child in root:
-            _escape_tag(child, transcriber, inline_tags, escape_text)
-
-        # Closing tag
-        if root.tag in inline_tags:
-            # root: <out> first <in> middle </in> last </out> tail
-            # ptr:                                           ^
-            transcriber.copy_until(root.tail_position)
+
+def _escape_opening_tag(tag, transcriber, inline_tags, escape_text):
+    """ Escape the start of `tag`: its opening tag and text. Single tags are
+        escaped whole, tail included.
+
+        :return: whether `tag` has contents; if so, its children and then
+            `_escape_closing_tag` must follow
+    """
+    if tag.text is None:
+        # This is a single tag, eg <br />
+        if tag.tag in inline_tags:
+            transcriber.copy_until(tag.tail_position)
         else:
-            # Lets escape the closing tag
             transcriber.add(escape_text(
-                transcriber.source[root.content_end:root.tail_position]
+                transcriber.source[tag.position:tag.tail_position]
             ))
-            # root: <out> first <in> middle </in> last </out> tail
-            # ptr:                                           ^
-            transcriber.skip_until(root.tail_position)
-
-    # Tail
-    transcriber.add(escape_text(root.tail))
-    # root: <out> first <in> middle </in> last </out> tail
+            transcriber.skip_until(tag.tail_position)
+        _escape_tail(tag, transcriber, escape_text)
+        return False
+
+    # Opening tag
+    if tag.tag in inline_tags:
+        # tag: <out> first <in> middle </in> last </out> tail
+        # ptr:       ^
+        transcriber.copy_until(tag.text_position)
+    else:
+        # Lets escape the opening tag
+        transcriber.add(escape_text(
+            transcriber.source[tag.position:tag.text_position]
+        ))
+        # tag: <out> first <in> middle </in> last </out> tail
+        # ptr:       ^
+        transcriber.skip_until(tag.text_position)
+
+    # Content
+    transcriber.add(escape_text(tag.text))
+    # tag: <out> first <in> middle </in> last </out> tail
+    # ptr:              ^
+    transcriber.skip(len(tag.text))
+    return True
+
+
+def _escape_closing_tag(tag, transcriber, inline_tags, escape_text):
+    """ Escape the end of `tag`, after its children: its closing tag and
+        tail.
+    """
+    if tag.tag in inline_tags:
+        # tag: <out> first <in> middle </in> last </out> tail
+        # ptr:                                           ^
+        transcriber.copy_until(tag.tail_position)
+    else:
+        # Lets escape the closing tag
+        transcriber.add(escape_text(
+            transcriber.source[tag.content_end:tag.tail_position]
+        ))
+        # tag: <out> first <in> middle </in> last </out> tail
+        # ptr:                                           ^
+        transcriber.skip_until(tag.tail_position)
+    _escape_tail(tag, transcriber, escape_text)
+
+
+def _escape_tail(tag, transcriber, escape_text):
+    transcriber.add(escape_text(tag.tail))
+    # tag: <out> first <in> middle </in> last </out> tail
     # ptr:                                                ^
-    transcriber.skip_until(root.end)
+    transcriber.skip_until(tag.end)
 
 
 class DumbXml(object):
@@ -107,10 +135,24 @@ class DumbXml(object):
         yields
     """
 
-    OPENING_TAG_PAT = r'^\s*\<(?P<name>[^\s\n\>]+)(?P<attrs>[^\>]*)\>'
+    OPENING_TAG_PAT = r'\s*\<(?P<name>[^\s\n\>]+)(?P<attrs>[^\>]*)\>'
     ATTR_PAT = r'\b(?P<key>[^=]+)="(?P<value>[^"]+)"'
     COMMENT = "!--"
     SINGLE_TAG_PAT = r'/\s*\>$'
+    # Filled in with the tag name by `find_closing`
+    CLOSING_TAG_PAT = ensure_unicode(r'\<(?:(?:{tag_name})|(?:/{tag_name}\>))')
+
+    # Compiled once, not for every instance
+    opening_tag_pat = re.compile(ensure_unicode(OPENING_TAG_PAT), re.DOTALL)
+    attr_pat = re.compile(ensure_unicode(ATTR_PAT))
+    single_tag_pat = re.compile(ensure_unicode(SINGLE_TAG_PAT))
+    any_tag_pat = re.compile(ensure_unicode(r'\<'), re.DOTALL)
+
+    # The patterns `find` builds for the tag names it is given, by tag names.
+    # Those come from the handlers, so there are only a few of them. The tag
+    # names `find_closing` looks for come from the documents, so those
+    # patterns are left to the re module's bounded cache
+    _find_pats = {}
 
     def __init__(self, content):
         """
@@ -126,15 +168,9 @@ class DumbXml(object):
             * inner: the inner content of the tag
         """
 
-        # Fix regex encoding
-        self.opening_tag_pat = re.compile(ensure_unicode(self.OPENING_TAG_PAT),
-                                          re.DOTALL)
-        self.attr_pat = re.compile(ensure_unicode(self.ATTR_PAT))
-        self.single_tag_pat = re.compile(ensure_unicode(self.SINGLE_TAG_PAT))
-
         self.content = content
 
-        if self.content[:4] == "<!--":
+        if self.content.startswith("<!--"):
             # Special case for comment
             self.inner_offset = 4
             self.name = self.COMMENT
@@ -142,7 +178,7 @@ class DumbXml(object):
             self.inner = self.content[4:self.content.index("-->")]
             return
 
-        opening_match = self.opening_tag_pat.search(content)
+        opening_match = self.opening_tag_pat.match(content)
         self.inner_offset = opening_match.end()
         self.name = opening_match.groupdict()['name']
         attrs = opening_match.groupdict()['attrs']
@@ -159,14 +195,17 @@ class DumbXml(object):
             tags = [tags]
 
         if not tags:
-            pat = re.compile(ensure_unicode(r'\<'), re.DOTALL)
+            pat = self.any_tag_pat
         else:
-            pat = re.compile(
-                ensure_unicode(r'\<(?:{})'.
-                               format('|'.join((re.escape(tag)
-                                                for tag in tags)))),
-                re.DOTALL
-            )
+            tags = tuple(tags)
+            pat = self._find_pats.get(tags)
+            if pat is None:
+                pat = self._find_pats[tags] = re.compile(
+                    ensure_unicode(r'\<(?:{})'.
+                                   format('|'.join((re.escape(tag)
+                                                    for tag in tags)))),
+                    re.DOTALL
+                )
 
         for match in pat.finditer(self.content):
             if match.start() == 0 or self._is_within_comment(match):
@@ -180,27 +219,26 @@ class DumbXml(object):
     def find_closing(self, start):
         # assume start is on a '<'
 
-        if self.content[start:start + 4] == "<!--":
+        # Positions are looked up in the whole content instead of in a copy of
+        # it from `start` onwards
+        if self.content.startswith("<!--", start):
             # Special case for comment
-            closing_start = self.content[start:].index("-->")
-            return start + closing_start, start + closing_start + 3
+            closing_start = self.content.index("-->", start)
+            return closing_start, closing_start + 3
 
-        opening_match = self.opening_tag_pat.search(self.content[start:])
+        opening_match = self.opening_tag_pat.match(self.content, start)
 
         if self.single_tag_pat.search(opening_match.group()):
             # Single tag, eg `<foo a="b" />`
-            return start + opening_match.end(), start + opening_match.end()
+            return opening_match.end(), opening_match.end()
 
         tag_name = opening_match.groupdict()['name']
         tag_pat = re.compile(
-            ensure_unicode(
-                r'\<(?:(?:{tag_name})|(?:/{tag_name}\>))'.
-                format(tag_name=re.escape(tag_name))
-            )
+            self.CLOSING_TAG_PAT.format(tag_name=re.escape(tag_name))
         )
-        match_generator = tag_pat.finditer(self.content[start:])
+        match_generator = tag_pat.finditer(self.content, start)
         first_match = next(match_generator)
-        assert first_match and first_match.start() == 0 and\
+        assert first_match and first_match.start() == start and\
             first_match.group()[1] != '/'
         count = 1
         for match in match_generator:
@@ -212,21 +250,18 @@ class DumbXml(object):
                 count += 1
 
             if count == 0:
-                return start + match.start(), start + match.end()
+                return match.start(), match.end()
 
     def _is_within_comment(self, match):
+        # Search backwards in place instead of in a reversed copy of the
+        # content. Positions are those of the last character of each token
+        end = match.start() + 1
         # Previous opening comment
-        try:
-            opening = match.start() -\
-                self.content[match.start()::-1].index("--!<")
-        except ValueError:
-            opening = None
+        opening = self.content.rfind("<!--", 0, end)
+        opening = opening + 3 if opening != -1 else None
         # Previous closing comment
-        try:
-            closing = match.start() -\
-                self.content[match.start()::-1].index(">--")
-        except ValueError:
-            closing = None
+        closing = self.content.rfind("-->", 0, end)
+        closing = closing + 2 if closing != -1 else None
 
         if opening is not None:
             if closing is not None:
@@ -350,22 +385,43 @@ class NewDumbXml(object):
     NEWLINE = u"\n"
     EQUAL_SIGN = u"="
 
+    # Either the end of the opening tag ('/' or '>') or the next attribute,
+    # whitespace before them included. Everything up to the '=' is the key,
+    # the value is enclosed in the first quote found after the '='
+    ATTRIBUTE_PAT = re.compile(ensure_unicode(
+        r'\s*(?:(?P<end>[/>])|'
+        r'(?P<key>[^\s/>][^=]*)=[^"\']*'
+        r'(?P<quote>["\'])(?P<value>.*?)(?P=quote))'
+    ), re.DOTALL | re.UNICODE)
+
+    # Everything up to the first '/', '>' or whitespace, may be empty
+    TAG_NAME_PAT = re.compile(ensure_unicode(r'[^\s/>]*'), re.UNICODE)
+
+    # The '>' that ends a tag, after optional whitespace
+    TAG_END_PAT = re.compile(ensure_unicode(r'\s*>'), re.UNICODE)
+
     class NOT_CACHED:
         "Special value for None because for some properties, None is valid"
 
     COMMENT = '!--'
 
+    # A document may hold thousands of tags, don't give each one a __dict__
+    __slots__ = ('source', 'start', '_position', '_tag', '_attrib',
+                 '_attrib_string', '_attributes', '_text_position', '_text',
+                 '_content_end', '_tail_position', '_tail')
+
     def __init__(self, source, start=0):
         self.source = source
         self.start = start
-        self._position = self._tag = self._attrib = self._attrib_string =\
-            self._attributes = self._text_position = self._text =\
-            self._content_end = self._tail_position = self._tail =\
-            self.NOT_CACHED
+        self._attrib = self._attrib_string = self._attributes =\
+            self._text_position = self._text = self._content_end =\
+            self._tail_position = self._tail = self.NOT_CACHED
 
+        # Position and tag are always needed, so they are found right away.
         # Start with tag because if this is a comment, it will mess up with the
         # retrieving of other attributes
-        self.tag
+        self._position = self._find_next_lt(start)
+        self._tag = self._find_tag()
 
     @property
     def position(self):
@@ -375,10 +431,6 @@ class NewDumbXml(object):
             ^
         """
 
-        if self._position is not self.NOT_CACHED:
-            return self._position
-
-        self._position = self._find_next_lt(self.start)
         return self._position
 
     @property
@@ -389,24 +441,7 @@ class NewDumbXml(object):
              ^^^^
         """
 
-        if self._tag is not self.NOT_CACHED:
-            return self._tag
-
-        start = self.position
-        end = start + len("<!--")
-        if self.source[start:end] == "<!--":
-            self._tag = self.COMMENT
-            self._process_comment()
-            return self._tag
-
-        for ptr in six.moves.xrange(self.position + 1, len(self.source)):
-            candidate = self.source[ptr]
-            if (candidate in (self.FORWARD_SLASH, self.GREATER_THAN) or
-                    candidate.isspace()):
-                self._tag = self.source[self.position + 1:ptr]
-                return self._tag
-        raise DumbXmlSyntaxError(u"Opening tag not closed on line {}".
-                                 format(self._find_line_number()))
+        return self._tag
 
     @property
     def attributes(self):
@@ -415,59 +450,24 @@ class NewDumbXml(object):
 
         start = self.position + 1 + len(self.tag)
         self._attributes = []
-        (status,
-         key_position, key, value_position, value, quote_type) = [None] * 6
 
-        for ptr in count(start):
-            try:
-                candidate = self.source[ptr]
-            except IndexError:
+        ptr = start
+        while True:
+            match = self.ATTRIBUTE_PAT.match(self.source, ptr)
+            if match is None:
                 raise DumbXmlSyntaxError(
                     u"Opening tag '{}' not closed on line {}".
                     format(self.tag, self._find_line_number())
                 )
-
-            # `status` lifecycle should be:
-            #   None -> IN_KEY -> AFTER_KEY -> IN_VALUE -> None -> ...
-            if status is None:
-                if candidate in (self.FORWARD_SLASH, self.GREATER_THAN):
-                    # <a .... /> or <a .... >
-                    #         ^             ^
-                    break
-                elif candidate.isspace():
-                    # <a   b="c">
-                    #    ^
-                    continue
-                else:
-                    # <a  b="c" ...>
-                    #     ^
-                    status, key_position, key = "IN_KEY", ptr, [candidate]
-            elif status == "IN_KEY":
-                if candidate == self.EQUAL_SIGN:
-                    # <a b="c" ... >
-                    #     ^
-                    status = "AFTER_KEY"
-                else:
-                    # <a bcd="ef" ... >
-                    #     ^
-                    key.append(candidate)
-            elif status == "AFTER_KEY":
-                if candidate in (self.SINGLE_QUOTE, self.DOUBLE_QUOTES):
-                    # <a b="cde" ... >
-                    #      ^
-                    (status, quote_type, value_position,
-                     value) = "IN_VALUE", candidate, ptr + 1, []
-            elif status == "IN_VALUE":
-                if candidate == quote_type:
-                    # <a b="c" ... >
-                    #        ^
-                    status = None
-                    self._attributes.append((key_position, u''.join(key),
-                                             value_position, u''.join(value)))
-                else:
-                    # <a b="cde" ... >
-                    #        ^
-                    value.append(candidate)
+            if match.group('end') is not None:
+                # <a .... /> or <a .... >
+                #         ^             ^
+                ptr = match.start('end')
+                break
+            self._attributes.append((match.start('key'), match.group('key'),
+                                     match.start('value'),
+                                     match.group('value')))
+            ptr = match.end()
 
         self._attrib_string = self.source[start:ptr]
 
@@ -503,23 +503,14 @@ class NewDumbXml(object):
         if candidate == self.FORWARD_SLASH:
             # This is a "single-tag", eg '<br />'
             self._text_position = None
-            start = ptr + 1
-            for ptr in six.moves.xrange(start, len(self.source)):
-                candidate = self.source[ptr]
-                if candidate.isspace():
-                    continue
-                elif candidate == self.GREATER_THAN:
-                    self._tail_position = ptr + 1
-                    return self._text_position
-                else:
-                    raise DumbXmlSyntaxError(
-                        u"Opening tag '{}' not closed on line {}".
-                        format(self.tag, self._find_line_number())
-                    )
-            raise DumbXmlSyntaxError(
-                u"Opening tag '{}' not closed on line {}".
-                format(self.tag, self._find_line_number())
-            )
+            match = self.TAG_END_PAT.match(self.source, ptr + 1)
+            if match is None:
+                raise DumbXmlSyntaxError(
+                    u"Opening tag '{}' not closed on line {}".
+                    format(self.tag, self._find_line_number())
+                )
+            self._tail_position = match.end()
+            return self._text_position
         elif candidate == self.GREATER_THAN:
             self._text_position = ptr + 1
             return self._text_position
@@ -555,39 +546,32 @@ class NewDumbXml(object):
         if self.text is None or self.tag == self.COMMENT:
             return
 
+        source, tag = self.source, self.tag
+        # Use `self.__class__` in case this is a subclass (eg to handle HTML)
+        cls = self.__class__
         start = self.text_position + len(self.text)
         while True:
-            if self.source[start + 1] == self.FORWARD_SLASH:
+            if source[start + 1] == self.FORWARD_SLASH:
                 # We found the closing tag
                 self._content_end = start
-                closing_tag = self.source[start + 2: start + 2 + len(self.tag)]
-                if closing_tag != self.tag:
+                tag_end = start + 2 + len(tag)
+                if not source.startswith(tag, start + 2):
                     raise DumbXmlSyntaxError(
                         u"Closing tag '{}' does not match opening tag '{}' on "
                         u"line {}".
-                        format(closing_tag, self.tag, self._find_line_number())
+                        format(source[start + 2:tag_end], tag,
+                               self._find_line_number())
                     )
-                for ptr in six.moves.xrange(start + 2 + len(self.tag),
-                                            len(self.source)):
-                    candidate = self.source[ptr]
-                    if candidate.isspace():
-                        continue
-                    elif candidate == self.GREATER_THAN:
-                        self._tail_position = ptr + 1
-                        return
-                    else:
-                        raise DumbXmlSyntaxError(
-                            u"Invalid closing of tag '{}' on line {}".
-                            format(self.tag, self._find_line_number())
-                        )
-                raise DumbXmlSyntaxError(
-                    u"Invalid closing of tag '{}' on line {}".
-                    format(self.tag, self._find_line_number())
-                )
+                match = self.TAG_END_PAT.match(source, tag_end)
+                if match is None:
+                    raise DumbXmlSyntaxError(
+                        u"Invalid closing of tag '{}' on line {}".
+                        format(tag, self._find_line_number())
+                    )
+                self._tail_position = match.end()
+                return
             else:
-                # Use `self.__class__` in case this is a subclass (eg to handle
-                # HTML)
-                inner = self.__class__(self.source, start)
+                inner = cls(source, start)
                 yield inner
                 start = inner.end
 
@@ -679,23 +663,31 @@ class NewDumbXml(object):
             for inner in child.find_descendants(*tags):
                 yield inner
 
+    def _find_tag(self):
+        start = self._position
+        if self.source.startswith("<!--", start):
+            self._process_comment()
+            return self.COMMENT
+
+        match = self.TAG_NAME_PAT.match(self.source, start + 1)
+        if match.end() >= len(self.source):
+            raise DumbXmlSyntaxError(u"Opening tag not closed on line {}".
+                                     format(self._find_line_number()))
+        return match.group()
+
     def _find_next_lt(self, start):
-        in_cdata = False
-        for ptr in six.moves.xrange(start, len(self.source)):
-            candidate = self.source[ptr]
-            if in_cdata:
-                if (candidate == ']' and
-                        self.source[ptr:ptr + len("]]>")] == "]]>"):
-                    in_cdata = False
-            else:
-                if candidate == self.LESS_THAN:
-                    # Check against CDATA
-                    if self.source[ptr:ptr + len("<![CDATA[")] == "<![CDATA[":
-                        in_cdata = True
-                    else:
-                        return ptr
+        source = self.source
+        ptr = source.find(self.LESS_THAN, start)
+        while ptr != -1:
+            # Check against CDATA
+            if not source.startswith("<![CDATA[", ptr):
+                return ptr
+            cdata_end = source.find("]]>", ptr + len("<![CDATA["))
+            if cdata_end == -1:
+                break
+            ptr = source.find(self.LESS_THAN, cdata_end + len("]]>"))
         # We reached the end of the string, lets return accordingly
-        return len(self.source)
+        return len(source)
 
     def _process_comment(self):
         # We already know position and tag
@@ -705,19 +697,17 @@ class NewDumbXml(object):
         self._attrib = {}
 
         self._text_position = self.position + len("<!--")
-        for ptr in six.moves.xrange(self._text_position, len(self.source)):
-            candidate = self.source[ptr]
-            if candidate == '-' and self.source[ptr:ptr + len("-->")] == "-->":
-                self._content_end = ptr
-                self._text = self.source[self.text_position:ptr]
-                self._tail_position = ptr + len("-->")
-                return
-        raise DumbXmlSyntaxError(u"Comment not closed on line {}".
-                                 format(self._find_line_number()))
+        end = self.source.find("-->", self._text_position)
+        if end == -1:
+            raise DumbXmlSyntaxError(u"Comment not closed on line {}".
+                                     format(self._find_line_number()))
+        self._content_end = end
+        self._text = self.source[self._text_position:end]
+        self._tail_position = end + len("-->")
 
     def _find_line_number(self, ptr=None):
         ptr = ptr or self.position
-        return self.source[:ptr].count(self.NEWLINE) + 1
+        return self.source.count(self.NEWLINE, 0, ptr) + 1
 
 
 for symbol in (NewDumbXml.BACKSLASH, NewDumbXml.FORWARD_SLASH,
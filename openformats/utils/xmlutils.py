@@ -106,7 +106,7 @@ class XMLUtils(object):
                     msg,
                     context=error_context
                 )
-        elif not text or text.strip() == "":
+        elif not text or text.isspace():
             return False
         return True
 
@@ -118,7 +118,8 @@ class XMLUtils(object):
         :param tag: The xml tag to be validated.
         :raises: ParseError if extra tail characters are found.
         """
-        if tag.tail.strip() != "":
+        tail = tag.tail
+        if tail and not tail.isspace():
             # Check for tail characters
             transcriber.copy_until(tag.tail_position)
             msg = (u"Found trailing characters after <{tag}> tag on line "
@@ -142,7 +143,8 @@ class XMLUtils(object):
         :param tag: The xml tag to be validated.
         :raises: ParseError if extra text characters are found.
         """
-        if tag.text and tag.text.strip() != "":
+        text = tag.text
+        if text and not text.isspace():
             # Check for text characters
             transcriber.copy_until(tag.text_position)
             msg = (u"Found leading characters inside <{tag}> tag on line "